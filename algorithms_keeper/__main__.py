@@ -4,7 +4,7 @@ import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, MutableMapping
+from typing import Any, AsyncIterator, MutableMapping
 
 from aiohttp import ClientSession, web
 from cachetools import LRUCache
@@ -22,6 +22,8 @@ if sys.version_info >= (3, 10):
 
 cache: MutableMapping[Any, Any] = LRUCache(maxsize=500)
 
+client_session_key = web.AppKey("client_session", ClientSession)
+
 sentry_init(
     dsn=os.environ.get("SENTRY_DSN"),
     integrations=[AioHttpIntegration(transaction_style="method_and_path_pattern")],
@@ -52,6 +54,17 @@ async def index(_: web.Request) -> web.Response:
     return web.Response(body=content, content_type="text/html")
 
 
+async def client_session_ctx(app: web.Application) -> AsyncIterator[None]:
+    """Create a single client session for the lifetime of the application.
+
+    Sharing the session keeps the connections to GitHub alive between the webhook
+    events instead of making a new TCP and TLS handshake for every event.
+    """
+    async with ClientSession() as session:
+        app[client_session_key] = session
+        yield
+
+
 @routes.get("/favicon.ico")
 async def favicon(_: web.Request) -> web.FileResponse:
     return web.FileResponse(STATIC_DIR.joinpath("favicon.ico"))
@@ -73,23 +86,23 @@ async def main(request: web.Request) -> web.Response:
             return web.Response(status=200, text="pong")
         event_info = f"{event.event}:{event.data['action']}"
         logger.info("event=%s delivery_id=%s", event_info, event.delivery_id)
-        async with ClientSession() as session:
-            gh = GitHubAPI(
-                installation_id=event.data["installation"]["id"],
-                session=session,
-                requester="TheAlgorithms/algorithms-keeper",
-                cache=cache,
-            )
-            # Give GitHub some time to reach internal consistency.
-            await asyncio.sleep(1)
-            if logger.isEnabledFor(logging.DEBUG):
-                callbacks = [func.__name__ for func in main_router.fetch(event)]
-                logger.debug("event=%s callbacks=%s", event_info, callbacks)
-            await main_router.dispatch(event, gh)
+        gh = GitHubAPI(
+            installation_id=event.data["installation"]["id"],
+            session=request.app[client_session_key],
+            requester="TheAlgorithms/algorithms-keeper",
+            cache=cache,
+        )
+        # Give GitHub some time to reach internal consistency.
+        await asyncio.sleep(1)
+        if logger.isEnabledFor(logging.DEBUG):
+            callbacks = [func.__name__ for func in main_router.fetch(event)]
+            logger.debug("event=%s callbacks=%s", event_info, callbacks)
+        await main_router.dispatch(event, gh)
         if gh.rate_limit is not None:  # pragma: no cover
             logger.info(
-                "ratelimit=%s, time_remaining=%s",
-                f"{gh.rate_limit.remaining}/{gh.rate_limit.limit}",
+                "ratelimit=%s/%s, time_remaining=%s",
+                gh.rate_limit.remaining,
+                gh.rate_limit.limit,
                 gh.rate_limit.reset_datetime - datetime.now(timezone.utc),
             )
         return web.Response(status=200)
@@ -101,6 +114,7 @@ async def main(request: web.Request) -> web.Response:
 if __name__ == "__main__":  # pragma: no cover
     app = web.Application()
     app.add_routes(routes)
+    app.cleanup_ctx.append(client_session_ctx)
     # Heroku dynamically assigns the app a port, so we can't set the port to a fixed
     # number. Heroku adds the port to the env, so we need to pull it from there.
     web.run_app(app, port=int(os.environ.get("PORT", 5000)))
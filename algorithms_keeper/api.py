@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from typing import Any, Mapping, MutableMapping
@@ -11,6 +12,10 @@ from gidgethub.aiohttp import GitHubAPI as BaseGitHubAPI
 # Timed token_cache for installation access token (1 minute less than an hour)
 token_cache: MutableMapping[int, str] = TTLCache(maxsize=10, ttl=1 * 59 * 60)
 
+# Lock per installation ID so that concurrent requests, even from different
+# ``GitHubAPI`` instances, do not create multiple tokens.
+token_locks: dict[int, asyncio.Lock] = {}
+
 # From `gidgethub.sansio.decipher_response()`
 # From `gidgethub.abc._request()#113`
 STATUS_OK: tuple[int, int, int, int] = (200, 201, 204, 304)
@@ -60,13 +65,20 @@ class GitHubAPI(BaseGitHubAPI):
             self._private_key = _get_private_key()
         installation_id = self._installation_id
         if installation_id not in token_cache:
-            data = await apps.get_installation_access_token(
-                self,
-                installation_id=str(installation_id),
-                app_id=os.environ["GITHUB_APP_ID"],
-                private_key=self._private_key,
-            )
-            token_cache[installation_id] = data["token"]
+            # The lock is created here as it needs a running event loop on Python 3.9.
+            lock = token_locks.get(installation_id)
+            if lock is None:
+                lock = token_locks[installation_id] = asyncio.Lock()
+            async with lock:
+                # The token might have been created while waiting for the lock.
+                if installation_id not in token_cache:
+                    data = await apps.get_installation_access_token(
+                        self,
+                        installation_id=str(installation_id),
+                        app_id=os.environ["GITHUB_APP_ID"],
+                        private_key=self._private_key,
+                    )
+                    token_cache[installation_id] = data["token"]
         return token_cache[installation_id]
 
     async def _request(
@@ -91,8 +103,11 @@ class GitHubAPI(BaseGitHubAPI):
         INFO: All actions taken by the bot.
         ERROR: Unknown error in the API call.
         """
-        if response.status in STATUS_OK:
-            loggerlevel = logger.info
+        level = logging.INFO if response.status in STATUS_OK else logging.ERROR
+        # Avoid decoding the response body when the record is going to be dropped.
+        if not logger.isEnabledFor(level):
+            return None
+        if level == logging.INFO:
             # Comments and reviews are too long to be logged for INFO level
             data = (
                 response.url.name.upper()
@@ -100,12 +115,12 @@ class GitHubAPI(BaseGitHubAPI):
                 else body.decode(UTF_8_CHARSET)
             )
         else:
-            loggerlevel = logger.error
             data = body.decode(UTF_8_CHARSET)
         version = response.version
         if version is not None:
             version = f"{version.major}.{version.minor}"
-        loggerlevel(
+        logger.log(
+            level,
             'api "%s %s %s %s" => %s',
             response.method,
             response.url.raw_path_qs,
@@ -44,8 +44,9 @@ async def check_ci_status_and_label(
     # - CheckRun event came from a commit made directly on master branch
     if pr_for_commit is None:
         logger.info(
-            "Pull request not found for commit: %s",
-            f"https://github.com/{repository}/commit/{commit_sha}",
+            "Pull request not found for commit: https://github.com/%s/commit/%s",
+            repository,
+            commit_sha,
         )
         return None
 
@@ -64,9 +65,9 @@ async def check_ci_status_and_label(
         "in_progress" not in all_check_run_status
         and "queued" not in all_check_run_status
     ):  # wait until all check runs are completed
-        current_labels: list[str] = [label["name"] for label in pr_for_commit["labels"]]
+        current_labels: set[str] = {label["name"] for label in pr_for_commit["labels"]}
         if any(
-            conclusion in [None, "failure", "timed_out"]
+            conclusion in {None, "failure", "timed_out"}
             for conclusion in all_check_run_conclusion
         ):  # Add the failure label only if it doesn't exist
             if Label.FAILED_TEST not in current_labels:
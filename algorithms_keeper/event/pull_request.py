@@ -21,7 +21,6 @@ digraph "PR stages" {
 """
 import asyncio
 import logging
-import re
 from typing import Any, Optional
 
 from gidgethub import routing
@@ -37,11 +36,13 @@ from algorithms_keeper.constants import (
     PR_REVIEW_COMMENT,
     Label,
 )
+from algorithms_keeper.event.check_run import check_ci_status_and_label
 from algorithms_keeper.parser import PythonParser
 
 # To disable this check, set the constant to 0.
 MAX_PR_PER_USER = 3
-STAGE_PREFIX = "awaiting"
+# Labels representing the stage of a pull request, managed only by the bot.
+STAGE_LABELS = frozenset({Label.CHANGE, Label.REVIEW})
 MAX_RETRIES = 5
 
 pull_request_router = routing.Router()
@@ -61,16 +62,21 @@ async def update_stage_label(
 
     If `next_label` argument is not provided, then only the first step is performed.
     """
+    stage_labels = []
     for label in pull_request["labels"]:
         # The bot should be smart enough to figure out that if the next_label
         # already exist, then there's no need to change the pull request stage.
         label_name = label["name"]
         if label_name == next_label:
-            return None
-        elif STAGE_PREFIX in label_name:
-            await utils.remove_label_from_pr_or_issue(
-                gh, label=label_name, pr_or_issue=pull_request
-            )
+            next_label = None
+            break
+        elif label_name in STAGE_LABELS:
+            stage_labels.append(label_name)
+    # Remove all the stage labels in one go instead of one request at a time.
+    if stage_labels:
+        await utils.remove_label_from_pr_or_issue(
+            gh, label=stage_labels, pr_or_issue=pull_request
+        )
     if next_label is not None:
         await utils.add_label_to_pr_or_issue(
             gh, label=next_label, pr_or_issue=pull_request
@@ -128,7 +134,8 @@ async def close_invalid_or_additional_pr(
         if not pr_body:
             comment = EMPTY_PR_BODY_COMMENT.format(user_login=pr_author)
             logger.info("Empty PR body: %s", pull_request["html_url"])
-        elif re.search(r"\[x]", pr_body, re.IGNORECASE) is None:
+        # A ticked checkbox in the pull request template: "[x]" or "[X]"
+        elif "[x]" not in pr_body and "[X]" not in pr_body:
             comment = CHECKBOX_NOT_TICKED_COMMENT.format(user_login=pr_author)
             logger.info("Empty checklist: %s", pull_request["html_url"])
 
@@ -147,7 +154,7 @@ async def close_invalid_or_additional_pr(
             if len(user_pr_numbers) > MAX_PR_PER_USER:
                 logger.info("Multiple open PRs: %s", pull_request["html_url"])
                 # Convert list of numbers to: "#1, #2, #3"
-                pr_number = "#{}".format(", #".join(map(str, user_pr_numbers)))
+                pr_number = ", ".join(f"#{number}" for number in user_pr_numbers)
                 await utils.close_pr_or_issue(
                     gh,
                     comment=MAX_PR_REACHED_COMMENT.format(
@@ -225,9 +232,11 @@ async def check_pr_files(
     # Default behavior is to ignore modified files but that can be changed.
     # This will come only from the commands module through the command:
     # ``@algorithms-keeper review-all``
-    for file in parser.files_to_check(ignore_modified):
-        code = await utils.get_file_content(gh, file=file)
-        parser.parse(file, code)
+    files = parser.files_to_check(ignore_modified)
+    sources = await utils.get_file_contents(gh, files=files)
+    for file, source in zip(files, sources):
+        parser.parse(file, source)
+    parser.fill_labels()
 
     if parser.labels_to_add:
         await utils.add_label_to_pr_or_issue(
@@ -266,8 +275,6 @@ async def check_ci_ready_for_review_pr(
     removed if the checks are passing or failing. Thus, we need to manually check it
     with respect to the latest commit on head.
     """
-    from algorithms_keeper.event.check_run import check_ci_status_and_label
-
     await check_ci_status_and_label(event, gh, *args, **kwargs)
 
 
@@ -353,9 +360,9 @@ async def check_merge_status(
             await asyncio.sleep(retry_interval)
             pull_request = await utils.update_pr(gh, pull_request=pull_request)
         else:
-            current_labels: list[str] = [
+            current_labels: set[str] = {
                 label["name"] for label in pull_request["labels"]
-            ]
+            }
             if not mergeable:
                 if Label.MERGE_CONFLICT not in current_labels:
                     await utils.add_label_to_pr_or_issue(
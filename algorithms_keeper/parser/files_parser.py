@@ -5,7 +5,7 @@ from algorithms_keeper.constants import Label
 from algorithms_keeper.utils import File
 
 # These files are updated automatically by a GitHub action in almost every pull request.
-IGNORE_FILES_FOR_TYPELABEL: set[str] = {"DIRECTORY.md"}
+IGNORE_FILES_FOR_TYPELABEL: frozenset[str] = frozenset({"DIRECTORY.md"})
 
 logger = logging.getLogger(__package__)
 
@@ -17,7 +17,7 @@ class BaseFilesParser:
     ``DOCS_EXTENSIONS`` and ``ACCEPTED_EXTENSIONS`` as per the language repository.
     """
 
-    pr_labels: list[str]
+    pr_labels: Collection[str]
     pr_html_url: str
 
     DOCS_EXTENSIONS: Collection[str] = ()
@@ -31,7 +31,8 @@ class BaseFilesParser:
         # A pull request object for easy access.
         self.pr = pull_request
         self.pr_files = pr_files
-        self.pr_labels = [label["name"] for label in pull_request["labels"]]
+        # Labels are only used for membership tests, so store them as a set.
+        self.pr_labels = frozenset(label["name"] for label in pull_request["labels"])
         self.pr_html_url = pull_request["html_url"]
 
     def validate_extension(self) -> str:
@@ -51,7 +52,9 @@ class BaseFilesParser:
         invalid_filepath = []
         for file in self.pr_files:
             filepath = file.path
-            if not filepath.suffix:
+            # ``PurePath.suffix`` is computed on every access, so look it up once.
+            suffix = filepath.suffix
+            if not suffix:
                 if ".github" not in filepath.parts:
                     if filepath.parent.name:  # noqa: SIM114
                         invalid_filepath.append(file.name)
@@ -59,7 +62,7 @@ class BaseFilesParser:
                     # root of the repository
                     elif not filepath.name.startswith("."):
                         invalid_filepath.append(file.name)
-            elif filepath.suffix not in self.ACCEPTED_EXTENSIONS:
+            elif suffix not in self.ACCEPTED_EXTENSIONS:
                 invalid_filepath.append(file.name)
         invalid_files = ", ".join(invalid_filepath)
         if invalid_files:
@@ -1,7 +1,8 @@
 import importlib
 import inspect
 import logging
-from typing import Any, Iterable, Iterator, Mapping
+import re
+from typing import Any, Iterable, Mapping, Pattern
 
 from fixit import CstLintRule, LintConfig
 from fixit.common.utils import LintRuleCollectionT
@@ -17,6 +18,10 @@ RULES_DOTPATH: str = "algorithms_keeper.parser.rules"
 
 DEFAULT_CONFIG: LintConfig = LintConfig(packages=[RULES_DOTPATH])
 
+# Naming convention for the test files as per pytest test discovery.
+# https://docs.pytest.org/en/reorganize-docs/new-docs/user/naming_conventions.html
+TEST_FILE_RE: Pattern[str] = re.compile(r"^test_|_test\.py$")
+
 logger = logging.getLogger(__package__)
 
 
@@ -45,36 +50,45 @@ def get_rules_from_config(config: LintConfig = DEFAULT_CONFIG) -> LintRuleCollec
     return rules
 
 
+# The rule packages are static for the lifetime of the process, so resolve them only
+# once instead of importing and scanning the packages for every pull request.
+DEFAULT_RULES: LintRuleCollectionT = get_rules_from_config()
+
+
 class PythonParser(BaseFilesParser):
     """Parser for all the Python files in the pull request.
 
     This object performs no I/O of its own as the logic needs to be separated. This
     means that the function instantiating the object needs to provide the source code
     of the file to be parsed. For this, there's a helper function ``files_to_check``
-    to generate the list of all the valid Python files in the provided pull request. The
+    to get the list of all the valid Python files in the provided pull request. The
     user function will request the file content from GitHub and pass it to the main
     function ``parse``.
     """
 
     _pr_report: PullRequestReviewRecord
     _rules: LintRuleCollectionT
-
-    DOCS_EXTENSIONS: tuple[str, ...] = (".md", ".rst")
-
-    ACCEPTED_EXTENSIONS: tuple[str, ...] = (
-        # Configuration files
-        ".ini",
-        ".toml",
-        ".yaml",
-        ".yml",
-        ".cfg",
-        # Data files
-        ".csv",
-        ".json",
-        ".txt",
-        # Good old Python file
-        ".py",
-        *DOCS_EXTENSIONS,
+    _python_files: list[File]
+    _contains_testfile: bool
+
+    DOCS_EXTENSIONS: frozenset[str] = frozenset({".md", ".rst"})
+
+    ACCEPTED_EXTENSIONS: frozenset[str] = frozenset(
+        {
+            # Configuration files
+            ".ini",
+            ".toml",
+            ".yaml",
+            ".yml",
+            ".cfg",
+            # Data files
+            ".csv",
+            ".json",
+            ".txt",
+            # Good old Python file
+            ".py",
+            *DOCS_EXTENSIONS,
+        }
     )
 
     def __init__(
@@ -85,11 +99,12 @@ class PythonParser(BaseFilesParser):
         super().__init__(pr_files, pull_request)
         self._pr_record = PullRequestReviewRecord()
         # Collection of rules are going to be static for a pull request, so let's
-        # extract it out and store it.
-        self._rules = get_rules_from_config()
+        # take a copy of the default rules as it might be modified below.
+        self._rules = set(DEFAULT_RULES)
+        self._classify_files()
         # If the pull request contains a test file as per the naming convention, there's
         # no need to run ``RequireDoctestRule``.
-        if self._contains_testfile():
+        if self._contains_testfile:
             self._rules.discard(RequireDoctestRule)
 
     @property
@@ -106,12 +121,12 @@ class PythonParser(BaseFilesParser):
     def collect_review_contents(self) -> list[str]:
         return self._pr_record.collect_review_contents()
 
-    def files_to_check(self, ignore_modified: bool) -> Iterator[File]:
-        """Generate all the ``File`` which should be checked.
+    def files_to_check(self, ignore_modified: bool) -> list[File]:
+        """Return all the ``File`` which should be checked.
 
-        The caller of this function should use a loop to generate and parse the files
-        one at a time. This way the labels will be filled only after all the files
-        have been parsed.
+        The caller of this function is responsible for fetching the content of the
+        files and passing it to ``parse``. Once all the files have been parsed, the
+        caller should call ``fill_labels``.
 
         Ignores:
 
@@ -120,28 +135,25 @@ class PythonParser(BaseFilesParser):
         - Optionally ignore files which were modified (Issue #11)
         - Files in the *scripts/* directory (Issue #11)
         """
-        for file in self.pr_files:
-            filepath = file.path
-            if (
-                # If *ignore_modified* is ``True``, yield only the added files,
-                # otherwise yield all the files.
-                (not ignore_modified or file.status == "added")
-                and filepath.suffix == ".py"
-                and "scripts" not in filepath.parts
-                and not filepath.name.startswith("__")
-                and (
-                    not (
-                        filepath.name.startswith("test_")
-                        or filepath.name.endswith("_test.py")
-                    )
-                )
-            ):
-                yield file
-        # Fill the labels **only** after all the files have been parsed.
+        # If *ignore_modified* is ``True``, return only the added files, otherwise
+        # return all the files.
+        if not ignore_modified:
+            return list(self._python_files)
+        return [file for file in self._python_files if file.status == "added"]
+
+    def fill_labels(self) -> None:
+        """Fill the labels to add and remove from the pull request.
+
+        This should **only** be called after all the files have been parsed.
+        """
         self._pr_record.fill_labels(self.pr_labels)
 
     def parse(self, file: File, source: bytes) -> None:
-        """Run the lint engine on the given *source* for the *file*."""
+        """Run the lint engine on the given *source* for the *file*.
+
+        *source* should be the raw bytes as received from GitHub. The parser detects
+        the encoding itself, so there's no need to decode it beforehand.
+        """
         try:
             reports = lint_file(
                 file.path,
@@ -158,14 +170,20 @@ class PythonParser(BaseFilesParser):
                 "Invalid Python code for the file: [%s] %s", file.name, self.pr_html_url
             )
 
-    def _contains_testfile(self) -> bool:
-        """Check whether any of the pull request files satisfy the naming convention
-        for test discovery."""
-        # https://docs.pytest.org/en/reorganize-docs/new-docs/user/naming_conventions.html
+    def _classify_files(self) -> None:
+        """Collect the Python files which should be checked and determine whether any
+        of the pull request files satisfy the naming convention for test discovery.
+
+        Both are done in a single pass over the pull request files.
+        """
+        self._python_files = []
+        self._contains_testfile = False
         for file in self.pr_files:
             filepath = file.path
-            if filepath.suffix == ".py" and (
-                filepath.name.startswith("test_") or filepath.name.endswith("_test.py")
-            ):
-                return True
-        return False
+            if filepath.suffix != ".py":
+                continue
+            filename = filepath.name
+            if TEST_FILE_RE.search(filename):
+                self._contains_testfile = True
+            elif "scripts" not in filepath.parts and not filename.startswith("__"):
+                self._python_files.append(file)
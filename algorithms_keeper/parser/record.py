@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Collection, Union
 
 from fixit.common.report import BaseLintRuleReport
@@ -77,16 +77,17 @@ class PullRequestReviewRecord:
         self, exc: Union[SyntaxError, ParserSyntaxError], filepath: str
     ) -> None:
         """Add any exception faced while parsing the source code."""
-        import traceback
-
-        message = traceback.format_exc(limit=1)
         # It seems that ``ParserSyntaxError`` is not a subclass of ``SyntaxError``,
         # the same information is stored under a different attribute. There is no
         # filename information in ``ParserSyntaxError``, thus the parameter `filepath`.
-        if isinstance(exc, SyntaxError):  # noqa: SIM108, pragma: no cover
+        # The message is built from the exception itself as the traceback only points
+        # inside the parser and is not useful to the contributor.
+        if isinstance(exc, SyntaxError):  # pragma: no cover
             lineno = exc.lineno or 1
+            message = f"{type(exc).__name__}: {exc.msg} (line {lineno})"
         else:
             lineno = exc.raw_line
+            message = f"{type(exc).__name__}: {exc}"
         body = (
             f"An error occurred while parsing the file: `{filepath}`\n"
             f"```python\n{message}\n```"
@@ -112,7 +113,18 @@ class PullRequestReviewRecord:
 
         This is how GitHub wants the *comments* value while creating the review.
         """
-        return [asdict(comment) for comment in self._comments]
+        # The field values are immutable ``str`` and ``int``, so a shallow copy is
+        # enough and ``dataclasses.asdict`` is not needed. ``vars(comment)`` cannot be
+        # used as ``side`` is not an init field and is only set on the class.
+        return [
+            {
+                "body": comment.body,
+                "path": comment.path,
+                "line": comment.line,
+                "side": comment.side,
+            }
+            for comment in self._comments
+        ]
 
     def collect_review_contents(self) -> list[str]:
         """Collect all the review comments as list of strings.
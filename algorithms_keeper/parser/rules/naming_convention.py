@@ -97,6 +97,7 @@ class NamingConventionRule(CstLintRule):
         Invalid("def oneWordInvalid(): pass"),
         Invalid("def Pascal_Case(): pass"),
         Invalid("valid = another_valid = Invalid = 5"),
+        Invalid("Invalid = Invalid = 5"),
         Invalid("(waLRus := 'operator')"),
         Invalid("def func(invalidParam, valid_param): pass"),
         Invalid("multiple, inValid, assignments = 1, 2, 3"),
@@ -114,6 +115,10 @@ class NamingConventionRule(CstLintRule):
     def __init__(self, context: CstContext) -> None:
         super().__init__(context)
         self._assigntarget_counter: int = 0
+        # Set of ``(id(node), nodename)`` already reported. In a multiple assignment
+        # such as ``Name = Name = 5``, the same ``Assign`` node would otherwise be
+        # reported once for every target.
+        self._reported: set[tuple[int, str]] = set()
 
     def visit_Assign(self, node: cst.Assign) -> None:
         metadata: Optional[Collection[QualifiedName]] = self.get_metadata(
@@ -197,5 +202,10 @@ class NamingConventionRule(CstLintRule):
         This is a convenience method as the same steps will be repeated for every
         visit functions which are to validate the name and report if found invalid.
         """
-        if not naming_convention.valid(nodename):
-            self.report(node, naming_convention.value.format(nodename=nodename))
+        if naming_convention.valid(nodename):
+            return None
+        key = (id(node), nodename)
+        if key in self._reported:
+            return None
+        self._reported.add(key)
+        self.report(node, naming_convention.value.format(nodename=nodename))
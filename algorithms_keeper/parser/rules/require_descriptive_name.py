@@ -5,7 +5,9 @@ from fixit import CstLintRule
 from fixit import InvalidTestCase as Invalid
 from fixit import ValidTestCase as Valid
 
-MESSAGE: str = "Please provide descriptive name for the {nodetype}: `{nodename}`"
+
+def missing_descriptive_name(nodetype: str, nodename: str) -> str:
+    return f"Please provide descriptive name for the {nodetype}: `{nodename}`"
 
 
 class RequireDescriptiveNameRule(CstLintRule):
@@ -79,6 +81,4 @@ class RequireDescriptiveNameRule(CstLintRule):
     ) -> None:
         nodename = node.name.value
         if len(nodename) == 1:
-            self.report(
-                node, message=MESSAGE.format(nodetype=nodetype, nodename=nodename)
-            )
+            self.report(node, message=missing_descriptive_name(nodetype, nodename))
@@ -1,18 +1,25 @@
-from typing import Union
+import re
+from pathlib import Path
+from typing import Pattern, Union
 
 import libcst as cst
-import libcst.matchers as m
 from fixit import CstContext, CstLintRule
 from fixit import InvalidTestCase as Invalid
 from fixit import ValidTestCase as Valid
 
-MISSING_DOCTEST: str = (
-    "As there is no test file in this pull request nor any test function or class in "
-    "the file `{filepath}`, please provide doctest for the function `{nodename}`"
-)
-
 INIT: str = "__init__"
 
+# A doctest example is any line in the docstring starting with the ``>>> `` prompt.
+DOCTEST_RE: Pattern[str] = re.compile(r"^\s*>>> ", re.MULTILINE)
+
+
+def missing_doctest(filepath: Path, nodename: str) -> str:
+    return (
+        "As there is no test file in this pull request nor any test function or class "
+        f"in the file `{filepath}`, please provide doctest for the function "
+        f"`{nodename}`"
+    )
+
 
 class RequireDoctestRule(CstLintRule):
     VALID = [
@@ -212,10 +219,13 @@ class RequireDoctestRule(CstLintRule):
         self._temporary: bool = False
 
     def should_skip_file(self) -> bool:
-        return self.context.file_path.match("web_programming/*")
+        # Equivalent to ``file_path.match("web_programming/*")`` without translating
+        # the glob pattern for every file.
+        return self.context.file_path.parent.name == "web_programming"
 
     def visit_Module(self, node: cst.Module) -> None:
-        self._skip_doctest = self._has_testnode(node) or self._has_doctest(node)
+        # Looking at the module docstring is cheaper than scanning the module body.
+        self._skip_doctest = self._has_doctest(node) or self._has_testnode(node)
 
     def visit_ClassDef(self, node: cst.ClassDef) -> None:
         # Temporary storage of the ``skip_doctest`` value only during the class visit.
@@ -224,72 +234,39 @@ class RequireDoctestRule(CstLintRule):
         # After leaving the class, ``skip_doctest`` should be reset to whatever the
         # value was before.
         self._temporary = self._skip_doctest
-        self._skip_doctest = self._has_doctest(node)
+        self._skip_doctest = self._skip_doctest or self._has_doctest(node)
 
     def leave_ClassDef(self, original_node: cst.ClassDef) -> None:
         self._skip_doctest = self._temporary
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        # The flag is checked first to avoid extracting the docstring for every
+        # function when the doctest checks are being skipped.
+        if self._skip_doctest:
+            return None
         nodename = node.name.value
         if nodename != INIT and not self._has_doctest(node):
-            self.report(
-                node,
-                MISSING_DOCTEST.format(
-                    filepath=self.context.file_path, nodename=nodename
-                ),
-            )
-
-    def _has_doctest(
-        self, node: Union[cst.Module, cst.ClassDef, cst.FunctionDef]
-    ) -> bool:
+            self.report(node, missing_doctest(self.context.file_path, nodename))
+
+    @staticmethod
+    def _has_doctest(node: Union[cst.Module, cst.ClassDef, cst.FunctionDef]) -> bool:
         """Check whether the given node contains doctests.
 
-        If the ``_skip_doctest`` attribute is ``True``, the function will by default
-        return ``True``, otherwise it will extract the docstring and look for doctest
-        patterns (>>> ) in it. If there is no docstring for the node, this will mean
-        the absence of doctest.
+        This will extract the docstring and look for doctest patterns (>>> ) in it.
+        If there is no docstring for the node, this will mean the absence of doctest.
+        The caller is responsible for checking the ``_skip_doctest`` attribute first.
         """
-        if not self._skip_doctest:
-            docstring = node.get_docstring()
-            if docstring is not None:
-                for line in docstring.splitlines():
-                    if line.strip().startswith(">>> "):
-                        return True
-            return False
-        return True
+        # The raw docstring is enough as the pattern allows for leading whitespace,
+        # so skip the ``inspect.cleandoc`` processing.
+        docstring = node.get_docstring(clean=False)
+        return docstring is not None and DOCTEST_RE.search(docstring) is not None
 
     @staticmethod
     def _has_testnode(node: cst.Module) -> bool:
-        return m.matches(
-            node,
-            m.Module(
-                body=[
-                    # Sequence wildcard matchers matches LibCAST nodes in a row in a
-                    # sequence. It does not implicitly match on partial sequences. So,
-                    # when matching against a sequence we will need to provide a
-                    # complete pattern. This often means using helpers such as
-                    # ``ZeroOrMore()`` as the first and last element of the sequence.
-                    m.ZeroOrMore(),
-                    m.AtLeastN(
-                        n=1,
-                        matcher=m.OneOf(
-                            m.FunctionDef(
-                                name=m.Name(
-                                    value=m.MatchIfTrue(
-                                        lambda value: value.startswith("test_")
-                                    )
-                                )
-                            ),
-                            m.ClassDef(
-                                name=m.Name(
-                                    value=m.MatchIfTrue(
-                                        lambda value: value.startswith("Test")
-                                    )
-                                )
-                            ),
-                        ),
-                    ),
-                    m.ZeroOrMore(),
-                ]
-            ),
+        """Check whether the module contains a test function or class at the top
+        level as per the naming convention for test discovery."""
+        return any(
+            (isinstance(stmt, cst.FunctionDef) and stmt.name.value.startswith("test_"))
+            or (isinstance(stmt, cst.ClassDef) and stmt.name.value.startswith("Test"))
+            for stmt in node.body
         )
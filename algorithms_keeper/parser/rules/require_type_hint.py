@@ -3,15 +3,19 @@ from fixit import CstContext, CstLintRule
 from fixit import InvalidTestCase as Invalid
 from fixit import ValidTestCase as Valid
 
-MISSING_TYPE_HINT: str = "Please provide type hint for the parameter: `{nodename}`"
+IGNORE_PARAM: set[str] = {"self", "cls"}
 
-MISSING_RETURN_TYPE_HINT: str = (
-    "Please provide return type hint for the function: `{nodename}`. "
-    "**If the function does not return a value, please provide "
-    "the type hint as:** `def function() -> None:`"
-)
 
-IGNORE_PARAM: set[str] = {"self", "cls"}
+def missing_type_hint(nodename: str) -> str:
+    return f"Please provide type hint for the parameter: `{nodename}`"
+
+
+def missing_return_type_hint(nodename: str) -> str:
+    return (
+        f"Please provide return type hint for the function: `{nodename}`. "
+        "**If the function does not return a value, please provide "
+        "the type hint as:** `def function() -> None:`"
+    )
 
 
 class RequireTypeHintRule(CstLintRule):
@@ -119,11 +123,11 @@ class RequireTypeHintRule(CstLintRule):
 
     def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
         if node.returns is None:
-            self.report(node, MISSING_RETURN_TYPE_HINT.format(nodename=node.name.value))
+            self.report(node, missing_return_type_hint(node.name.value))
 
     def visit_Param(self, node: cst.Param) -> None:
         # Annotating parameters in ``lambda`` is not possible.
         if self._lambda_counter == 0:
             nodename = node.name.value
             if node.annotation is None and nodename not in IGNORE_PARAM:
-                self.report(node, MISSING_TYPE_HINT.format(nodename=nodename))
+                self.report(node, missing_type_hint(nodename))
@@ -1,5 +1,4 @@
 import libcst as cst
-import libcst.matchers as m
 from fixit import CstLintRule
 from fixit import InvalidTestCase as Invalid
 from fixit import ValidTestCase as Valid
@@ -28,23 +27,21 @@ class UseFstringRule(CstLintRule):
     ]
 
     def visit_Call(self, node: cst.Call) -> None:
-        if m.matches(
-            node,
-            m.Call(
-                func=m.Attribute(value=m.SimpleString(), attr=m.Name(value="format"))
-            ),
+        func = node.func
+        if (
+            isinstance(func, cst.Attribute)
+            and isinstance(func.value, cst.SimpleString)
+            and func.attr.value == "format"
         ):
             self.report(node)
 
     def visit_BinaryOperation(self, node: cst.BinaryOperation) -> None:
+        left = node.left
         if (
-            m.matches(
-                node, m.BinaryOperation(left=m.SimpleString(), operator=m.Modulo())
-            )
+            isinstance(node.operator, cst.Modulo)
+            and isinstance(left, cst.SimpleString)
             # SimpleString can be bytes and fstring don't support bytes.
             # https://www.python.org/dev/peps/pep-0498/#no-binary-f-strings
-            and isinstance(
-                cst.ensure_type(node.left, cst.SimpleString).evaluated_value, str
-            )
+            and isinstance(left.evaluated_value, str)
         ):
             self.report(node)
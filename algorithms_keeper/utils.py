@@ -12,6 +12,7 @@ The rest of the arguments must be keyword-only arguments. This is done to
 maintain consistency throughout the module and improve readability in files
 that uses all the given functions.
 """
+import asyncio
 import urllib.parse
 from base64 import b64decode
 from dataclasses import dataclass
@@ -21,6 +22,9 @@ from typing import Any, Mapping, Optional, Union
 from algorithms_keeper.api import GitHubAPI
 from algorithms_keeper.constants import PR_REVIEW_BODY
 
+# Maximum number of file contents to request from GitHub at the same time.
+MAX_CONCURRENT_FETCHES = 8
+
 
 @dataclass(frozen=True)
 class File:
@@ -85,11 +89,7 @@ async def add_label_to_pr_or_issue(
     construct it using `issue_url`. This is done to make this function versatile so
     that we can add a label to either the issue or pull request.
     """
-    labels_url = (
-        pr_or_issue["labels_url"]
-        if "labels_url" in pr_or_issue
-        else pr_or_issue["issue_url"] + "/labels"
-    )
+    labels_url = pr_or_issue.get("labels_url") or pr_or_issue["issue_url"] + "/labels"
     await gh.post(
         labels_url,
         data={"labels": [label] if isinstance(label, str) else label},
@@ -111,20 +111,21 @@ async def remove_label_from_pr_or_issue(
     construct it using the issue_url. This is done to make this function versatile so
     that we can remove a label from either the issue or pull request.
     """
-    labels_url = (
-        pr_or_issue["labels_url"]
-        if "labels_url" in pr_or_issue
-        else pr_or_issue["issue_url"] + "/labels"
-    )
+    labels_url = pr_or_issue.get("labels_url") or pr_or_issue["issue_url"] + "/labels"
     label_list = [label] if isinstance(label, str) else label
+    oauth_token = await gh.access_token
     # We can only remove labels one at a time or all (every label in the pull request
-    # or issue) at once.
-    for label in label_list:
-        parse_label = urllib.parse.quote(label)
-        await gh.delete(
-            f"{labels_url}/{parse_label}",
-            oauth_token=await gh.access_token,
+    # or issue) at once. The requests are independent, so send them concurrently.
+    # The label is a single path segment, so a "/" in its name must be quoted as well.
+    await asyncio.gather(
+        *(
+            gh.delete(
+                f"{labels_url}/{urllib.parse.quote(label, safe='')}",
+                oauth_token=oauth_token,
+            )
+            for label in label_list
         )
+    )
 
 
 async def get_user_open_pr_numbers(
@@ -170,20 +171,28 @@ async def close_pr_or_issue(
     As everything is going to be done by the bot, we will make comments compulsory
     so as to know why was this pull request or issue closed.
     """
+    # The comment is posted first so that it appears before the closing event in the
+    # timeline.
     await add_comment_to_pr_or_issue(gh, comment=comment, pr_or_issue=pr_or_issue)
+    # The label has to be present before closing as the ``closed`` event payload is
+    # used to check for it (see ``event.pull_request.remove_awaiting_labels``).
     if label is not None:
         await add_label_to_pr_or_issue(gh, label=label, pr_or_issue=pr_or_issue)
-    await gh.patch(
-        pr_or_issue["url"],
-        data={"state": "closed"},
-        oauth_token=await gh.access_token,
-    )
-    try:
-        # The review requests will be coming from the CODEOWNERS file
-        if pr_or_issue["requested_reviewers"]:
-            await remove_requested_reviewers_from_pr(gh, pull_request=pr_or_issue)
-    except KeyError:
-        pass
+    requests = [
+        gh.patch(
+            pr_or_issue["url"],
+            data={"state": "closed"},
+            oauth_token=await gh.access_token,
+        )
+    ]
+    # The review requests will be coming from the CODEOWNERS file. Issues don't have
+    # the `requested_reviewers` field. Removing them does not affect the closing, so
+    # both the requests can be made concurrently.
+    if pr_or_issue.get("requested_reviewers"):
+        requests.append(
+            remove_requested_reviewers_from_pr(gh, pull_request=pr_or_issue)
+        )
+    await asyncio.gather(*requests)
 
 
 async def remove_requested_reviewers_from_pr(
@@ -228,6 +237,21 @@ async def get_file_content(gh: GitHubAPI, *, file: File) -> bytes:
     return b64decode(data["content"])
 
 
+async def get_file_contents(gh: GitHubAPI, *, files: list[File]) -> list[bytes]:
+    """Return the content of all the given files, in the same order.
+
+    The file contents are independent of each other, so they are requested
+    concurrently with at most ``MAX_CONCURRENT_FETCHES`` requests at a time.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch(file: File) -> bytes:
+        async with semaphore:
+            return await get_file_content(gh, file=file)
+
+    return await asyncio.gather(*(fetch(file) for file in files))
+
+
 async def create_pr_review(
     gh: GitHubAPI, *, pull_request: Mapping[str, Any], comments: list[dict[str, Any]]
 ) -> None:
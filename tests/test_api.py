@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, AsyncGenerator, Dict
 
 import aiohttp
@@ -5,7 +6,7 @@ import pytest
 import pytest_asyncio
 from gidgethub import apps, sansio
 
-from algorithms_keeper.api import GitHubAPI, token_cache
+from algorithms_keeper.api import GitHubAPI, token_cache, token_locks
 
 from .utils import number, token
 
@@ -50,6 +51,33 @@ async def test_access_token(
     assert cached_token == token
 
 
+@pytest.mark.asyncio()
+async def test_access_token_created_once(
+    github_api: GitHubAPI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    call_count = 0
+
+    async def mock_get_token(*args: Any, **kwargs: Any) -> Dict[str, str]:
+        nonlocal call_count
+        call_count += 1
+        # Give the other requests a chance to run while the token is being created.
+        await asyncio.sleep(0)
+        return {"token": token}
+
+    monkeypatch.setattr(apps, "get_installation_access_token", mock_get_token)
+    monkeypatch.setenv("GITHUB_APP_ID", "")
+    monkeypatch.setenv("GITHUB_PRIVATE_KEY", "")
+    token_cache.clear()  # Make sure the token_cache is cleared
+    token_locks.clear()  # Locks should not be shared with other event loops
+    # A separate instance for the same installation, like another webhook event.
+    other_github_api = GitHubAPI(number, github_api._session, "algorithms-keeper")
+    access_tokens = await asyncio.gather(
+        *(gh.access_token for gh in (github_api, other_github_api) for _ in range(3))
+    )
+    assert access_tokens == [token] * 6
+    assert call_count == 1
+
+
 @pytest.mark.asyncio()
 async def test_headers_and_log(github_api: GitHubAPI) -> None:
     request_headers = sansio.create_headers("algorithms-keeper")
@@ -9,6 +9,7 @@ from .utils import number
 @pytest.fixture()
 def client(loop, aiohttp_client):  # type: ignore
     app = web.Application()
+    app.cleanup_ctx.append(main.client_session_ctx)
     app.router.add_get("/", main.index)
     app.router.add_get("/health", main.health)
     app.router.add_post("/", main.main)
@@ -96,7 +96,7 @@ def test_type_label(parser: PythonParser, expected: str) -> None:
 def test_files_to_check(
     parser: PythonParser, ignore_modified: bool, expected: int
 ) -> None:
-    assert len(list(parser.files_to_check(ignore_modified))) == expected
+    assert len(parser.files_to_check(ignore_modified)) == expected
 
 
 def test_record_error() -> None:
@@ -111,9 +111,16 @@ def test_record_error() -> None:
     parser = get_parser("invalid_syntax.py")
     for file in parser.files_to_check(True):
         parser.parse(file, source.encode("utf-8"))
+    parser.fill_labels()
     assert not parser.labels_to_add
     assert not parser.labels_to_remove
     assert len(parser._pr_record._comments) == 1
+    comment = parser._pr_record._comments[0]
+    assert comment.line == 6
+    # The message from the exception itself and not the full traceback.
+    assert "ParserSyntaxError" in comment.body
+    assert "@ 6:" in comment.body
+    assert "Traceback" not in comment.body
 
 
 @pytest.mark.parametrize(
@@ -127,6 +134,7 @@ def test_lineno_exist(filename: str, expected: int) -> None:
     parser = get_parser(filename)
     for file in parser.files_to_check(True):
         parser.parse(file, get_source(filename))
+    parser.fill_labels()
     assert len(parser._pr_record._comments) == expected
     assert len(parser.labels_to_add) == 1
     assert not parser.labels_to_remove
@@ -138,6 +146,7 @@ def test_lineno_exist_multiple_types() -> None:
     parser = get_parser("multiple_types.py")
     for file in parser.files_to_check(True):
         parser.parse(file, source.encode("utf-8"))
+    parser.fill_labels()
     assert len(parser._pr_record._comments) == 1
     assert len(parser.labels_to_add) == 3
     assert not parser.labels_to_remove
@@ -148,6 +157,7 @@ def test_same_lineno_multiple_source() -> None:
     parser = get_parser("first_file.py, second_file.py")
     for file in parser.files_to_check(True):
         parser.parse(file, source.encode("utf-8"))
+    parser.fill_labels()
     assert len(parser._pr_record._comments) == 2
     assert len(parser.labels_to_add) == 3
     assert not parser.labels_to_remove
@@ -200,6 +210,7 @@ def test_combinations(
     parser.pr_labels = labels
     for file in parser.files_to_check(True):
         parser.parse(file, get_source(file.name))
+    parser.fill_labels()
     assert len(parser._pr_record._comments) == expected
     assert len(parser.labels_to_add) == add_count
     assert len(parser.labels_to_remove) == remove_count
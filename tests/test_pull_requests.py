@@ -821,6 +821,31 @@ async def test_max_pr_by_user(
             MockGitHubAPI(),
             ExpectedData(delete_url=[f"{labels_url}/{quote(Label.CHANGE)}"]),
         ),
+        # Only the stage labels managed by the bot should be removed, not any other
+        # label which happens to contain the word "awaiting".
+        (
+            Event(
+                data={
+                    "action": "submitted",
+                    "review": {
+                        "state": "approved",
+                        "author_association": "MEMBER",
+                    },
+                    "pull_request": {
+                        "labels": [
+                            {"name": "awaiting triage"},
+                            {"name": Label.CHANGE},
+                        ],
+                        "issue_url": issue_url,
+                    },
+                    "sender": {"type": "User"},
+                },
+                event="pull_request_review",
+                delivery_id="approved_with_non_stage_awaiting_label",
+            ),
+            MockGitHubAPI(),
+            ExpectedData(delete_url=[f"{labels_url}/{quote(Label.CHANGE)}"]),
+        ),
         # No labels to add and remove while in draft mode.
         (
             Event(
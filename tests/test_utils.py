@@ -1,6 +1,6 @@
 import urllib.parse
 from pathlib import Path
-from typing import Dict, cast
+from typing import Any, Dict, List, Tuple, cast
 
 import pytest
 
@@ -145,6 +145,17 @@ async def test_remove_multiple_labels() -> None:
     assert f"{labels_url}/{parse_label2}" in gh.delete_url
 
 
+@pytest.mark.asyncio()
+async def test_remove_label_with_slash() -> None:
+    # The label is a single path segment, so the slash should be quoted as well.
+    pr_or_issue = {"issue_url": issue_url}
+    gh = MockGitHubAPI()
+    await utils.remove_label_from_pr_or_issue(
+        cast(GitHubAPI, gh), label="good/first issue", pr_or_issue=pr_or_issue
+    )
+    assert gh.delete_url == [f"{labels_url}/good%2Ffirst%20issue"]
+
+
 @pytest.mark.asyncio()
 async def test_get_user_open_pr_numbers() -> None:
     getiter = {
@@ -248,6 +259,36 @@ async def test_close_pr_or_issue_with_label() -> None:
     assert gh.delete_url == []
 
 
+@pytest.mark.asyncio()
+async def test_close_pr_or_issue_label_before_closing() -> None:
+    # The ``closed`` event payload should contain the label as it is used to remove
+    # the awaiting labels from an invalid pull request.
+    pull_request = {
+        "url": pr_url,
+        "comments_url": comments_url,
+        "issue_url": issue_url,
+        "requested_reviewers": [],
+    }
+    calls: List[Tuple[str, str]] = []
+    gh = MockGitHubAPI()
+    post, patch = gh.post, gh.patch
+
+    async def mock_post(url: str, **kwargs: Any) -> Any:
+        calls.append(("post", url))
+        return await post(url, **kwargs)
+
+    async def mock_patch(url: str, **kwargs: Any) -> Any:
+        calls.append(("patch", url))
+        return await patch(url, **kwargs)
+
+    gh.post = mock_post  # type: ignore
+    gh.patch = mock_patch  # type: ignore
+    await utils.close_pr_or_issue(
+        cast(GitHubAPI, gh), comment=comment, pr_or_issue=pull_request, label="invalid"
+    )
+    assert calls == [("post", comments_url), ("post", labels_url), ("patch", pr_url)]
+
+
 @pytest.mark.asyncio()
 async def test_get_pr_files() -> None:
     getiter = {
@@ -294,6 +335,28 @@ async def test_get_file_content() -> None:
     assert contents_url in gh.getitem_url
 
 
+@pytest.mark.asyncio()
+async def test_get_file_contents() -> None:
+    first_url = f"{contents_url}&first"
+    second_url = f"{contents_url}&second"
+    getitem = {
+        # b64encode(b"first") and b64encode(b"second")
+        first_url: {"content": "Zmlyc3Q=\n"},
+        second_url: {"content": "c2Vjb25k\n"},
+    }
+    gh = MockGitHubAPI(getitem=getitem)
+    result = await utils.get_file_contents(
+        cast(GitHubAPI, gh),
+        files=[
+            utils.File("first.py", Path("first.py"), first_url, "added"),
+            utils.File("second.py", Path("second.py"), second_url, "added"),
+        ],
+    )
+    assert result == [b"first", b"second"]
+    assert first_url in gh.getitem_url
+    assert second_url in gh.getitem_url
+
+
 @pytest.mark.asyncio()
 async def test_create_pr_review() -> None:
     pull_request = {"url": pr_url, "head": {"sha": sha}}